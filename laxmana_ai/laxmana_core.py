@@ -8,9 +8,104 @@ Core architecture for the LAXMANA AI system with advanced NLP and reasoning capa
 
 import json
 import logging
+import random
+import re
+from collections import deque
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_dumps_stdlib(obj: Any) -> bytes:
+    """
+    Encode obj as compact UTF-8 JSON, byte-for-byte like orjson.dumps
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps_orjson(obj: Any) -> bytes:
+    """
+    Encode obj as compact UTF-8 JSON with orjson
+    """
+    return orjson.dumps(obj)
+
+
+# Encoder used for exports, chosen once at import
+_json_dumps = _json_dumps_orjson if orjson is not None else _json_dumps_stdlib
+
+
+# Reply ids, in the priority order of the original if/elif chain
+_GREETING, _NAME, _QUANTUM, _MACHINE_LEARNING, _COMPARISON, _HELP, _QUESTION = range(7)
+
+# Short keywords only count as whole words ("hi" must not match "this")
+_WORD_KEYWORDS = {
+    "hello": _GREETING,
+    "hi": _GREETING,
+    "ml": _MACHINE_LEARNING,
+    "help": _HELP,
+}
+
+_PHRASE_KEYWORDS = {
+    "name": _NAME,
+    "quantum": _QUANTUM,
+    "machine learning": _MACHINE_LEARNING,
+    "different": _COMPARISON,
+    "better": _COMPARISON,
+    "?": _QUESTION,
+}
+
+# Unicode letters, so accented words are not split into ASCII fragments
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+# Single-pass scanner for phrases and the "?" question marker; the lookahead
+# reports overlapping matches so min() over reply ids sees every keyword
+_PHRASE_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_PHRASE_KEYWORDS, key=len, reverse=True))) + "))"
+)
+
+
+# Inputs up to this length are memoized; the cache keeps their text, so
+# long inputs bypass it to keep its memory small and bounded
+_MAX_CACHED_INPUT = 64
+
+
+def _match_reply(user_lower: str) -> Optional[int]:
+    """
+    Return the highest-priority reply id for lowercased input, or None
+    """
+    tokens = set(_WORD_RE.findall(user_lower))
+    matches = {_WORD_KEYWORDS[token] for token in tokens & _WORD_KEYWORDS.keys()}
+    matches.update(_PHRASE_KEYWORDS[m.group(1)] for m in _PHRASE_RE.finditer(user_lower))
+    return min(matches) if matches else None
+
+
+_match_reply_cached = lru_cache(maxsize=256)(_match_reply)
+
+
+NAME = "LAXMANA"
+
+# Replies are baked once at import since the assistant name is fixed
+_REPLIES = {
+    _GREETING: f"Hello! I am {NAME}, your advanced AI assistant. How can I assist you today?",
+    _NAME: f"I am {NAME}, a next-generation AI assistant designed to be helpful, harmless, and honest.",
+    _QUANTUM: f"As {NAME}, I can explain quantum computing: It leverages quantum mechanical phenomena like superposition and entanglement to process information in ways classical computers cannot. This enables solving certain complex problems much faster than traditional computers.",
+    _MACHINE_LEARNING: f"{NAME}: Machine learning is a subset of AI that enables systems to learn and improve from experience without being explicitly programmed. It uses algorithms to analyze data, identify patterns, and make decisions with minimal human intervention.",
+    _COMPARISON: f"What makes {NAME} superior is our focus on: 1) Advanced reasoning capabilities, 2) Continuous learning and adaptation, 3) Ethical AI principles, 4) Multimodal understanding, and 5) Deep contextual awareness. We're designed to truly understand and address your needs.",
+    _HELP: f"{NAME} can assist with: answering questions, problem-solving, analysis, creative tasks, learning support, and much more. What specific assistance do you need?",
+    _QUESTION: f"That's an interesting question! As {NAME}, I'm designed to provide thoughtful, accurate responses. Could you elaborate more on what you'd like to know about this topic?",
+}
+
+_DEFAULT_REPLIES = (
+    f"I am {NAME}, an advanced AI assistant. I'm designed to be better than other AIs through continuous improvement and advanced reasoning. How can I help you?",
+    f"As {NAME}, I aim to be your most capable AI assistant. I combine advanced NLP, reasoning, and ethical principles. What would you like to explore?",
+    f"Greetings! I'm {NAME}, engineered to surpass existing AI systems through superior architecture and learning. How may I assist you today?"
+)
+
 
 class LaxmanaAI:
     """
@@ -21,73 +116,72 @@ class LaxmanaAI:
         """
         Initialize LAXMANA AI with configuration
         """
-        self.name = "LAXMANA"
+        self.name = NAME
         self.version = "1.0.0"
         self.config = config or {}
-        self.conversation_history = []
+        self.max_history = self.config.get("max_history", 1000)
+        if (not isinstance(self.max_history, int) or isinstance(self.max_history, bool)
+                or self.max_history < 0):
+            raise ValueError(f"max_history must be a non-negative int, got {self.max_history!r}")
+        # Each turn stores an input and a response entry, so cap whole turns
+        self.conversation_history = deque(maxlen=2 * self.max_history)
+        # Running count of history entries, unaffected by the cap
+        self.conversation_count = 0
         self.knowledge_base = {}
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(self.name)
         
-        self.logger.info(f"{self.name} v{self.version} initialized")
+        self.logger.info("%s v%s initialized", self.name, self.version)
     
-    def process_input(self, user_input: str) -> str:
+    def process_input(self, user_input: str, *, _user_lower: Optional[str] = None) -> str:
         """
         Process user input and generate response
+        
+        _user_lower is an internal fast path: user_input.lower(), if already computed
         """
-        self.logger.info(f"Processing input: {user_input}")
+        self.logger.info("Processing input: %s", user_input)
+        
+        # One timestamp per turn, shared by the input and response entries
+        timestamp = datetime.now().isoformat()
         
         # Add to conversation history
         self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "user_input": user_input
         })
         
         # Placeholder for advanced processing
-        response = self.generate_response(user_input)
+        response = self.generate_response(user_input, _user_lower=_user_lower)
         
         # Add response to history
         self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "response": response
         })
+        self.conversation_count += 2
         
         return response
     
-    def generate_response(self, user_input: str) -> str:
+    def generate_response(self, user_input: str, *, _user_lower: Optional[str] = None) -> str:
         """
         Generate intelligent response based on input
-        """
-        import random
         
+        _user_lower is an internal fast path: user_input.lower(), if already computed
+        """
         # Enhanced response logic
-        user_lower = user_input.lower()
+        user_lower = _user_lower if _user_lower is not None else user_input.lower()
         
-        if "hello" in user_lower or "hi" in user_lower:
-            return f"Hello! I am {self.name}, your advanced AI assistant. How can I assist you today?"
-        elif "name" in user_lower:
-            return f"I am {self.name}, a next-generation AI assistant designed to be helpful, harmless, and honest."
-        elif "quantum" in user_lower:
-            return f"As {self.name}, I can explain quantum computing: It leverages quantum mechanical phenomena like superposition and entanglement to process information in ways classical computers cannot. This enables solving certain complex problems much faster than traditional computers."
-        elif "machine learning" in user_lower or "ml" in user_lower:
-            return f"{self.name}: Machine learning is a subset of AI that enables systems to learn and improve from experience without being explicitly programmed. It uses algorithms to analyze data, identify patterns, and make decisions with minimal human intervention."
-        elif "different" in user_lower or "better" in user_lower:
-            return f"What makes {self.name} superior is our focus on: 1) Advanced reasoning capabilities, 2) Continuous learning and adaptation, 3) Ethical AI principles, 4) Multimodal understanding, and 5) Deep contextual awareness. We're designed to truly understand and address your needs."
-        elif "help" in user_lower:
-            return f"{self.name} can assist with: answering questions, problem-solving, analysis, creative tasks, learning support, and much more. What specific assistance do you need?"
-        elif "?" in user_input:
-            # General question handling
-            return f"That's an interesting question! As {self.name}, I'm designed to provide thoughtful, accurate responses. Could you elaborate more on what you'd like to know about this topic?"
+        # Keyword matching is deterministic, so repeated short inputs hit the cache
+        if len(user_lower) <= _MAX_CACHED_INPUT:
+            reply_id = _match_reply_cached(user_lower)
         else:
-            # Default response with variation
-            default_responses = [
-                f"I am {self.name}, an advanced AI assistant. I'm designed to be better than other AIs through continuous improvement and advanced reasoning. How can I help you?",
-                f"As {self.name}, I aim to be your most capable AI assistant. I combine advanced NLP, reasoning, and ethical principles. What would you like to explore?",
-                f"Greetings! I'm {self.name}, engineered to surpass existing AI systems through superior architecture and learning. How may I assist you today?"
-            ]
-            return random.choice(default_responses)
+            reply_id = _match_reply(user_lower)
+        
+        if reply_id is not None:
+            return _REPLIES[reply_id]
+        
+        # Default response with variation
+        return random.choice(_DEFAULT_REPLIES)
     
     def update_knowledge(self, knowledge_data: Dict):
         """
@@ -103,15 +197,23 @@ class LaxmanaAI:
         return {
             "name": self.name,
             "version": self.version,
-            "conversation_count": len(self.conversation_history),
+            "conversation_count": self.conversation_count,
             "knowledge_base_size": len(self.knowledge_base)
         }
+    
+    def export_history(self) -> bytes:
+        """
+        Serialize the conversation history to UTF-8 encoded JSON
+        """
+        return _json_dumps(list(self.conversation_history))
 
 
 def main():
     """
     Main function to demonstrate LAXMANA AI
     """
+    logging.basicConfig(level=logging.INFO)
+    
     print("Initializing LAXMANA AI...")
     laxmana = LaxmanaAI()
     
@@ -120,11 +222,12 @@ def main():
     
     while True:
         user_input = input("\nYou: ")
-        if user_input.lower() == 'quit':
+        user_lower = user_input.lower()
+        if user_lower == 'quit':
             print("Shutting down LAXMANA AI...")
             break
         
-        response = laxmana.process_input(user_input)
+        response = laxmana.process_input(user_input, _user_lower=user_lower)
         print(f"\nLAXMANA: {response}")
 
 
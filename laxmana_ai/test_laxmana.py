@@ -3,6 +3,9 @@ Test script for LAXMANA AI
 Demonstrates the basic functionality of the LAXMANA AI system
 """
 
+import json
+
+import laxmana_core
 from laxmana_core import LaxmanaAI
 
 def test_laxmana():
@@ -20,7 +23,8 @@ def test_laxmana():
         "What is your name?",
         "Explain quantum computing in simple terms",
         "How are you different from other AIs?",
-        "Tell me about machine learning"
+        "Tell me about machine learning",
+        "Ça va? Explique-moi l'apprentissage automatique ✨"
     ]
     
     for user_input in test_inputs:
@@ -31,6 +35,74 @@ def test_laxmana():
     # Get system info
     info = laxmana.get_system_info()
     print(f"\nSystem Info: {info}")
+    
+    # Export conversation history
+    history = laxmana.export_history()
+    print(f"History export: {len(history)} bytes")
+    assert json.loads(history) == list(laxmana.conversation_history)
+
+def test_json_encoders():
+    """
+    The stdlib fallback and orjson encode history to the same bytes
+    """
+    sample = [{"timestamp": "2024-01-01T00:00:00", "user_input": "Ça va? ✨", "count": 2}]
+    expected = '[{"timestamp":"2024-01-01T00:00:00","user_input":"Ça va? ✨","count":2}]'.encode("utf-8")
+    
+    assert laxmana_core._json_dumps_stdlib(sample) == expected
+    if laxmana_core.orjson is not None:
+        assert laxmana_core._json_dumps_orjson(sample) == expected
+
+def test_keyword_matching():
+    """
+    Short keywords only match whole words, including in non-ASCII text
+    """
+    assert laxmana_core._match_reply("hi there") == laxmana_core._GREETING
+    assert laxmana_core._match_reply("this") != laxmana_core._GREETING
+    assert laxmana_core._match_reply("machine") != laxmana_core._GREETING
+    assert laxmana_core._match_reply("hiérarchie") is None
+    
+    # Overlapping phrases are all seen by the scanner
+    found = {m.group(1) for m in laxmana_core._PHRASE_RE.finditer("quantumachine learning")}
+    assert found == {"quantum", "machine learning"}
+
+def test_history_cap():
+    """
+    max_history keeps whole turns while conversation_count keeps growing
+    """
+    laxmana = LaxmanaAI({"max_history": 1})
+    laxmana.process_input("Hello")
+    laxmana.process_input("Help")
+    
+    assert len(laxmana.conversation_history) == 2
+    assert laxmana.conversation_history[0]["user_input"] == "Help"
+    assert laxmana.get_system_info()["conversation_count"] == 4
+    
+    for bad_value in (-1, None, "5", 2.5, True):
+        try:
+            LaxmanaAI({"max_history": bad_value})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"max_history={bad_value!r} was accepted")
+
+def test_reply_cache():
+    """
+    Only short inputs are kept in the keyword match cache
+    """
+    laxmana = LaxmanaAI()
+    cache_info = laxmana_core._match_reply_cached.cache_info
+    
+    laxmana.generate_response("help " * laxmana_core._MAX_CACHED_INPUT)
+    size = cache_info().currsize
+    laxmana.generate_response("a fresh long input " * laxmana_core._MAX_CACHED_INPUT)
+    assert cache_info().currsize == size
+    
+    laxmana.generate_response("a fresh short input")
+    assert cache_info().currsize == size + 1
 
 if __name__ == "__main__":
-    test_laxmana()
\ No newline at end of file
+    test_laxmana()
+    test_json_encoders()
+    test_keyword_matching()
+    test_history_cap()
+    test_reply_cache()
\ No newline at end of file